@@ -6,24 +6,144 @@ This module combines all statistical functions into a single file for
 
 import math
 from collections import Counter
-from typing import Union
+from functools import cached_property
+from typing import Optional, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; fall back to NumPy reductions
+    njit = None
+
 # Type alias for numeric lists
 NumericList = list[Union[int, float]]
 
+# Below this size a plain sort is cheaper than np.partition's overhead
+_PARTITION_MIN_SIZE = 64
+
+_INT64_MAX = np.iinfo(np.int64).max
+
+# Reduction kernels, compiled with numba when it is installed
+if njit is not None:
+    # Let LLVM reorder sums for SIMD but keep NaN and inf semantics
+    _FASTMATH = {"reassoc", "contract"}
+
+    @njit(parallel=True, fastmath=_FASTMATH, cache=True)
+    def _sum(arr: np.ndarray) -> float:
+        """Compute the sum of a 1-D float64 array."""
+        s = 0.0
+        for i in prange(arr.shape[0]):
+            s += arr[i]
+        return s
+
+    @njit(parallel=True, fastmath=_FASTMATH, cache=True)
+    def _sum_sq_diff(arr: np.ndarray, m: float) -> float:
+        """Compute the sum of squared deviations of ``arr`` from ``m``."""
+        s = 0.0
+        for i in prange(arr.shape[0]):
+            s += (arr[i] - m) ** 2
+        return s
+
+    @njit(parallel=True, fastmath=_FASTMATH, cache=True)
+    def _sum_prod_diff(
+        a: np.ndarray, b: np.ndarray, ma: float, mb: float
+    ) -> float:
+        """Compute the sum of products of deviations of ``a`` and ``b``."""
+        s = 0.0
+        for i in prange(a.shape[0]):
+            s += (a[i] - ma) * (b[i] - mb)
+        return s
+
+else:
+
+    def _sum(arr: np.ndarray) -> float:
+        """Compute the sum of a 1-D float64 array with NumPy."""
+        return float(arr.sum(dtype=np.float64))
+
+    def _sum_sq_diff(arr: np.ndarray, m: float) -> float:
+        """Compute the sum of squared deviations with NumPy."""
+        dev = arr - np.float64(m)
+        return float(dev @ dev)
+
+    def _sum_prod_diff(
+        a: np.ndarray, b: np.ndarray, ma: float, mb: float
+    ) -> float:
+        """Compute the sum of products of deviations with NumPy."""
+        return float((a - ma) @ (b - mb))
+
+
+def _min_max(arr: np.ndarray) -> tuple[float, float]:
+    """Compute the minimum and maximum of a non-empty 1-D array.
+
+    NumPy's SIMD min/max propagates NaN and outruns a numba loop, which
+    either drops NaN under fastmath or cannot vectorize without it.
+    """
+    # Python scalars, so differences of int64 extrema cannot wrap
+    return arr.min().item(), arr.max().item()
+
+
+def _as_int(arr: np.ndarray) -> Optional[np.ndarray]:
+    """Return ``arr`` as a contiguous integer array if it holds integers.
+
+    Args:
+        arr: Validated 1-D numeric array
+
+    Returns:
+        np.ndarray or None: int64 copy of the data (uint64 data is kept
+            unsigned, since it may not fit in int64), or None for float
+            and arbitrary-precision data
+    """
+    if arr.dtype.kind not in "biu":
+        return None
+    dtype = np.uint64 if arr.dtype == np.uint64 else np.int64
+    return np.ascontiguousarray(arr, dtype=dtype)
+
+
+def _standardize(arr: np.ndarray, axis: int) -> np.ndarray:
+    """Centre and scale ``arr`` along ``axis`` for Pearson correlation.
+
+    Each slice is divided by the square root of its sum of squared
+    deviations, so the dot product of two standardized slices is their
+    correlation coefficient. Rounding can push that product just outside
+    [-1, 1], so callers clip it.
+
+    Args:
+        arr: float64 array of samples along ``axis``
+        axis: Axis holding the samples
+
+    Returns:
+        np.ndarray: Standardized copy of ``arr``
+
+    Raises:
+        ValueError: If there are fewer than two samples
+        ZeroDivisionError: If any slice has zero variance
+    """
+    if arr.shape[axis] < 2:
+        raise ValueError("Input must have at least two samples")
+    centred = arr - arr.mean(axis=axis, keepdims=True)
+    norm = np.sqrt((centred * centred).sum(axis=axis, keepdims=True))
+    if np.any(norm == 0):
+        raise ZeroDivisionError(
+            "Cannot calculate when one or more datasets have zero variance"
+        )
+    return centred / norm
+
 
 class Validator:
     """Validation utility methods for statistical calculations."""
 
     @staticmethod
-    def validate_numeric_list(data: NumericList) -> None:
+    def validate_numeric_list(data: NumericList) -> np.ndarray:
         """Validate that input data is a non-empty list of numeric values.
 
         Args:
             data: List of numeric values to validate
+
+        Returns:
+            np.ndarray: The input data as a 1-D numeric array
+
         Raises:
             TypeError: If input is not a list or contains non-numeric values
             ValueError: If input list is empty
@@ -32,8 +152,18 @@ class Validator:
             raise TypeError("Input must be a list or numpy array")
         if len(data) == 0:
             raise ValueError("Input list cannot be empty")
-        if not all(isinstance(x, (int, float)) for x in data):
+        try:
+            arr = np.asarray(data)
+        except (TypeError, ValueError):
+            raise TypeError("All elements must be numeric") from None
+        # Python ints beyond 64 bits only fit an object array
+        if arr.dtype == object and arr.ndim == 1:
+            if not all(isinstance(x, (int, float)) for x in arr):
+                raise TypeError("All elements must be numeric")
+            return arr
+        if arr.ndim != 1 or arr.dtype.kind not in "biuf":
             raise TypeError("All elements must be numeric")
+        return arr
 
     @staticmethod
     def validate_equal_length(data1: NumericList, data2: NumericList) -> None:
@@ -49,14 +179,68 @@ class Validator:
         if len(data1) != len(data2):
             raise ValueError("Input lists must have equal length")
 
+    @staticmethod
+    def validate_numeric_matrix(data: np.ndarray) -> np.ndarray:
+        """Validate that input data is a 2-D numeric array.
+
+        Args:
+            data: 2-D array (or nested list) of numeric values to validate
+
+        Returns:
+            np.ndarray: The input data as a 2-D numeric array
+
+        Raises:
+            TypeError: If input is not 2-D or contains non-numeric values
+            ValueError: If input is empty
+        """
+        try:
+            arr = np.asarray(data)
+        except (TypeError, ValueError):
+            raise TypeError("All elements must be numeric") from None
+        if arr.ndim != 2:
+            raise TypeError("Input must be a 2-D array")
+        if arr.dtype.kind not in "biuf":
+            raise TypeError("All elements must be numeric")
+        if arr.size == 0:
+            raise ValueError("Input cannot be empty")
+        return arr
+
 
 class CentralTendency:
     """Central tendency measures."""
 
     def __init__(self, data: NumericList):
         """Initialize a CentralTendency object with data."""
-        Validator.validate_numeric_list(data)
+        arr = Validator.validate_numeric_list(data)
         self.data = data
+        self._src = arr
+        self._n = arr.size
+        self._int_arr = _as_int(arr)
+
+    @cached_property
+    def _arr(self) -> np.ndarray:
+        """float64 copy of the data, built on first access."""
+        # Integer data only needs it when the exact sum could overflow
+        return np.ascontiguousarray(self._src, dtype=np.float64)
+
+    @cached_property
+    def _mean(self) -> float:
+        """Arithmetic mean, computed on first access."""
+        n = self._n
+        if self._src.dtype == object:
+            # Integers beyond 64 bits: sum exactly with Python ints
+            return sum(self._src.tolist()) / n
+        if self._int_arr is not None:
+            lo, hi = self._int_extrema
+            # Sum exactly in 64 bits only when it provably cannot wrap
+            if max(-lo, hi) * n <= _INT64_MAX:
+                return int(self._int_arr.sum()) / n
+        return _sum(self._arr) / n
+
+    @cached_property
+    def _int_extrema(self) -> tuple[int, int]:
+        """Minimum and maximum of integer data, computed on first access."""
+        return _min_max(self._int_arr)
 
     def mean(self) -> float:
         """Calculate the arithmetic mean of a list of numbers.
@@ -71,7 +255,7 @@ class CentralTendency:
             TypeError: If input is not a list or contains non-numeric values
             ValueError: If input list is empty
         """
-        return sum(self.data) / len(self.data)
+        return self._mean
 
     def median(self) -> float:
         """Calculate the median of a list of numbers.
@@ -80,18 +264,29 @@ class CentralTendency:
             data: List of numeric values
 
         Returns:
-            float: Median of the input data
+            float: Median of the input data. Integer data with an odd
+            number of values gives the middle value as an int.
 
         Raises:
             TypeError: If input is not a list or contains non-numeric values
             ValueError: If input list is empty
         """
-        sorted_data = sorted(self.data)
-        n = len(sorted_data)
+        n = self._n
         mid = n // 2
+        # Object arrays hold integers beyond 64 bits; sort them exactly
+        if n < _PARTITION_MIN_SIZE or self._src.dtype == object:
+            values = self.data
+            if isinstance(values, np.ndarray):
+                values = values.tolist()
+            sorted_data = sorted(values)
+            if n % 2 == 0:
+                return (sorted_data[mid - 1] + sorted_data[mid]) / 2
+            return sorted_data[mid]
+        arr = self._arr if self._int_arr is None else self._int_arr
         if n % 2 == 0:
-            return (sorted_data[mid - 1] + sorted_data[mid]) / 2
-        return sorted_data[mid]
+            part = np.partition(arr, [mid - 1, mid])
+            return (part[mid - 1].item() + part[mid].item()) / 2
+        return np.partition(arr, mid)[mid].item()
 
     def mode(self) -> Union[float, list[float]]:
         """Calculate the mode of a list of numbers.
@@ -101,25 +296,109 @@ class CentralTendency:
 
         Returns:
             float or List[float]: Mode(s) of the input data.
-            If multiple modes exist,returns a list of modes.
+            If multiple modes exist, returns a list of modes in the order
+            they first appear in the data.
 
         Raises:
             TypeError: If input is not a list or contains non-numeric values
             ValueError: If input list is empty
         """
-        counts = Counter(self.data)
-        max_count = max(counts.values())
-        modes = [x for x, count in counts.items() if count == max_count]
-        return modes[0] if len(modes) == 1 else modes
+        if self._src.dtype == object:
+            # Integers beyond 64 bits: count exactly, in first-seen order
+            counts = Counter(self._src.tolist())
+            top = max(counts.values())
+            modes = [x for x, count in counts.items() if count == top]
+            return modes[0] if len(modes) == 1 else modes
+        is_int = self._int_arr is not None
+        arr = self._int_arr if is_int else self._arr
+        small_span = False
+        if is_int:
+            lo, hi = self._int_extrema
+            # Counting by offset is O(n) when the value span is small
+            small_span = hi - lo < 10 * arr.size
+        if small_span:
+            counts = np.bincount((arr - lo).astype(np.intp))
+            is_mode = np.flatnonzero(counts == counts.max())
+            modes = is_mode.astype(arr.dtype) + lo
+            if modes.size > 1:
+                hits = arr[np.isin(arr, modes)]
+                _, first = np.unique(hits, return_index=True)
+                modes = hits[np.sort(first)]
+        else:
+            values, first, counts = np.unique(
+                arr, return_index=True, return_counts=True
+            )
+            is_mode = counts == counts.max()
+            modes = values[is_mode][np.argsort(first[is_mode])]
+        if self._src.dtype.kind == "b":
+            # Booleans are counted as 0/1; hand back bools like the input
+            modes = modes.astype(bool)
+        if modes.size == 1:
+            return modes[0].item() if is_int else float(modes[0])
+        return modes.tolist()
 
 
 class Dispersion:
-    """Dispersion measures."""
+    """Dispersion measures.
 
-    def __init__(self, data: NumericList):
-        """Initialize a Dispersion object with data."""
-        Validator.validate_numeric_list(data)
+    Objects returned by merge summarize their inputs without keeping
+    them, so their ``data`` attribute is None.
+    """
+
+    def __init__(self, data: NumericList, dtype: type = np.float64):
+        """Initialize a Dispersion object with data.
+
+        Args:
+            data: List of numeric values
+            dtype: np.float32 or np.float64, used to store the data. float32
+                halves memory traffic on large inputs; reductions still
+                accumulate in float64.
+
+        Raises:
+            TypeError: If dtype is not np.float32 or np.float64
+        """
+        arr = Validator.validate_numeric_list(data)
+        if np.dtype(dtype) not in (np.float32, np.float64):
+            raise TypeError("dtype must be np.float32 or np.float64")
         self.data = data
+        self._arr = np.ascontiguousarray(arr, dtype=dtype)
+        self._n = arr.size
+        if arr.dtype.kind in "biu":
+            # Exact integer extrema, taken now so no int64 copy is kept
+            self._extrema = _min_max(arr)
+        elif arr.dtype == object:
+            # Integers beyond 64 bits would round in the float copy
+            values = arr.tolist()
+            self._extrema = (min(values), max(values))
+
+    @classmethod
+    def _from_summary(
+        cls,
+        n: int,
+        moments: tuple[float, float],
+        extrema: tuple[float, float],
+    ) -> "Dispersion":
+        """Build a Dispersion object from summary statistics alone."""
+        disp = cls.__new__(cls)
+        disp.data = None
+        disp._arr = None
+        disp._n = n
+        # Pre-fill the cached properties so no data is ever needed
+        disp._moments = moments
+        disp._extrema = extrema
+        return disp
+
+    @cached_property
+    def _moments(self) -> tuple[float, float]:
+        """Mean and sum of squared deviations, computed on first access."""
+        # Two passes vectorize; a one-pass update divides on every element
+        mean = _sum(self._arr) / self._n
+        return mean, _sum_sq_diff(self._arr, mean)
+
+    @cached_property
+    def _extrema(self) -> tuple[float, float]:
+        """Minimum and maximum, computed on first access."""
+        return _min_max(self._arr)
 
     def variance(self, sample: bool = True) -> float:
         """Calculate the variance of a list of numbers.
@@ -136,10 +415,9 @@ class Dispersion:
             TypeError: If input is not a list or contains non-numeric values
             ValueError: If input list is empty
         """
-        data_mean = CentralTendency(self.data).mean()
-        squared_diff = [(x - data_mean) ** 2 for x in self.data]
-        n = len(self.data)
-        return sum(squared_diff) / (n - 1 if sample else n)
+        _, m2 = self._moments
+        n = self._n
+        return m2 / (n - 1 if sample else n)
 
     def std_dev(self, sample: bool = True) -> float:
         """Calculate the standard deviation of a list of numbers.
@@ -171,7 +449,40 @@ class Dispersion:
             TypeError: If input is not a list or contains non-numeric values
             ValueError: If input list is empty
         """
-        return max(self.data) - min(self.data)
+        # Extrema are Python scalars, so integer data gives an exact int
+        mn, mx = self._extrema
+        return mx - mn
+
+    def merge(self, other: "Dispersion") -> "Dispersion":
+        """Combine the summaries of two datasets.
+
+        Counts, means, squared deviations and extrema are merged with the
+        pairwise update of Chan et al. in constant time, so chunks can be
+        summarized separately, dropped, and combined tree-wise. The result
+        supports variance, std_dev, range and further merges, but keeps no
+        data of its own.
+
+        Args:
+            other: Dispersion object summarizing the data to append
+
+        Returns:
+            Dispersion: Dispersion object summarizing both datasets
+        """
+        n_a, n_b = self._n, other._n
+        mean_a, m2_a = self._moments
+        mean_b, m2_b = other._moments
+        min_a, max_a = self._extrema
+        min_b, max_b = other._extrema
+        n = n_a + n_b
+        delta = mean_b - mean_a
+        return type(self)._from_summary(
+            n,
+            (
+                mean_a + delta * n_b / n,
+                m2_a + m2_b + delta**2 * n_a * n_b / n,
+            ),
+            (min(min_a, min_b), max(max_a, max_b)),
+        )
 
 
 class Correlation:
@@ -179,11 +490,19 @@ class Correlation:
 
     def __init__(self, data1: NumericList, data2: NumericList):
         """Initialize a Correlation object with data1 and data2."""
-        Validator.validate_numeric_list(data1)
-        Validator.validate_numeric_list(data2)
+        arr1 = Validator.validate_numeric_list(data1)
+        arr2 = Validator.validate_numeric_list(data2)
         Validator.validate_equal_length(data1, data2)
         self.data1 = data1
         self.data2 = data2
+        self._arr1 = np.ascontiguousarray(arr1, dtype=np.float64)
+        self._arr2 = np.ascontiguousarray(arr2, dtype=np.float64)
+
+    @cached_property
+    def _means(self) -> tuple[float, float]:
+        """Means of both datasets, computed on first access."""
+        n = self._arr1.size
+        return _sum(self._arr1) / n, _sum(self._arr2) / n
 
     def covariance(self, sample: bool = True) -> float:
         """Calculate the covariance between two lists of numbers.
@@ -201,13 +520,10 @@ class Correlation:
             TypeError: If inputs are not lists or contain non-numeric values
             ValueError: If input lists are empty or have different lengths
         """
-        mean1 = CentralTendency(self.data1).mean()
-        mean2 = CentralTendency(self.data2).mean()
-        n = len(self.data1)
-        diffs = [
-            (x - mean1) * (y - mean2) for x, y in zip(self.data1, self.data2)
-        ]
-        return sum(diffs) / (n - 1 if sample else n)
+        mean1, mean2 = self._means
+        c = _sum_prod_diff(self._arr1, self._arr2, mean1, mean2)
+        n = self._arr1.size
+        return c / (n - 1 if sample else n)
 
     def correlation(self) -> float:
         """Calculate the Pearson correlation coefficient between two lists of numbers.
@@ -224,17 +540,59 @@ class Correlation:
             ValueError: If input lists are empty or have different lengths
             ZeroDivisionError: If either dataset has zero standard deviation
         """  # noqa: E501
-        var1 = Dispersion(self.data1).variance()
-        var2 = Dispersion(self.data2).variance()
-
-        if var1 == 0 or var2 == 0:
+        mean1, mean2 = self._means
+        m2_1 = _sum_sq_diff(self._arr1, mean1)
+        m2_2 = _sum_sq_diff(self._arr2, mean2)
+        if m2_1 == 0 or m2_2 == 0:
             raise ZeroDivisionError(
                 "Cannot calculate when one or both datasets have zero variance"
             )
+        c = _sum_prod_diff(self._arr1, self._arr2, mean1, mean2)
+        # The n - 1 denominators of covariance and variance cancel out
+        return c / math.sqrt(m2_1 * m2_2)
+
+    @staticmethod
+    def batch_correlate(data: np.ndarray) -> np.ndarray:
+        """Calculate the Pearson correlation matrix between columns.
+
+        Args:
+            data: 2-D array of shape (n_samples, n_features)
 
-        # Calculate correlation
-        cov = self.covariance()
-        return cov / (math.sqrt(var1) * math.sqrt(var2))
+        Returns:
+            np.ndarray: Correlation matrix of shape (n_features, n_features)
+
+        Raises:
+            TypeError: If input is not 2-D or contains non-numeric values
+            ValueError: If input has fewer than two samples
+            ZeroDivisionError: If any column has zero standard deviation
+        """
+        arr = Validator.validate_numeric_matrix(data).astype(np.float64)
+        z = _standardize(arr, axis=0)
+        return np.clip(z.T @ z, -1.0, 1.0)
+
+    @staticmethod
+    def correlate_many(data: np.ndarray, target: NumericList) -> np.ndarray:
+        """Calculate the Pearson correlation of each row with a target.
+
+        Args:
+            data: 2-D array of shape (k, n), one dataset per row
+            target: List of n numeric values
+
+        Returns:
+            np.ndarray: Correlation coefficients of shape (k,)
+
+        Raises:
+            TypeError: If inputs are not numeric or data is not 2-D
+            ValueError: If inputs are empty, have fewer than two samples
+                or have different lengths
+            ZeroDivisionError: If any row or the target has zero variance
+        """
+        arr = Validator.validate_numeric_matrix(data).astype(np.float64)
+        y = Validator.validate_numeric_list(target).astype(np.float64)
+        Validator.validate_equal_length(arr[0], y)
+        x_z = _standardize(arr, axis=1)
+        y_z = _standardize(y, axis=0)
+        return np.clip(x_z @ y_z, -1.0, 1.0)
 
 
 class Visualizer:
@@ -7,3 +7,14 @@ empty_data = []
 unequal_data = [1, 2]
 multi_mode_data = [1, 1, 2, 2, 3]
 constant_data = [5, 5, 5]
+large_offset_data = [1e9 + 4, 1e9 + 7, 1e9 + 13, 1e9 + 16]
+mixed_sign_data = [-3.5, 2.0, -7.25, 4.0, 0.0]
+large_data = list(range(99, -1, -1))
+wide_span_data = [-(10**9), 10**9, 10**9, 0]
+int64_limit_data = [-(2**62), 2**62, 2**62]
+nan_data = [1.0, float("nan"), 2.0]
+big_int_data = [2**64, 2**64 + 2, 1]
+unsorted_modes_data = [3, 3, 1, 1]
+int64_sum_overflow_data = [2**62] * 4
+uint64_data = [2**63, 2**63]
+bool_data = [True, True, False]
@@ -1,6 +1,9 @@
 """Tests for CentralTendency and Dispersion."""
 
+import math
+
 import fake_data as fd
+import numpy as np
 import pytest
 from ministats import CentralTendency, Dispersion
 
@@ -51,3 +54,164 @@ def test_range() -> None:
     """Test range calculation (max - min)."""
     d = Dispersion(fd.valid_data)
     assert d.range() == 3
+
+
+def test_variance_large_offset() -> None:
+    """Test variance stays accurate when values share a large offset."""
+    d = Dispersion(fd.large_offset_data)
+    assert d.variance(sample=True) == pytest.approx(30.0)
+
+
+def test_range_mixed_sign() -> None:
+    """Test range calculation on negative and positive floats."""
+    d = Dispersion(fd.mixed_sign_data)
+    assert d.range() == pytest.approx(11.25)
+
+
+def test_median_large() -> None:
+    """Test median calculation on a list large enough to use partition."""
+    ct = CentralTendency(fd.large_data)
+    assert ct.median() == pytest.approx(49.5)
+
+
+def test_variance_float32() -> None:
+    """Test sample variance calculation with float32 storage."""
+    d = Dispersion(fd.valid_data, dtype=np.float32)
+    assert d.variance(sample=True) == pytest.approx(1.3)
+    assert d.range() == 3
+
+
+@pytest.mark.parametrize(
+    "dtype",
+    [
+        np.int64,
+        np.float16,
+        pytest.param(
+            np.longdouble,
+            marks=pytest.mark.skipif(
+                np.dtype(np.longdouble) == np.float64,
+                reason="longdouble is float64 on this platform",
+            ),
+        ),
+    ],
+)
+def test_dispersion_invalid_dtype(dtype: type) -> None:
+    """Test Dispersion raises TypeError for unsupported dtypes."""
+    with pytest.raises(TypeError):
+        Dispersion(fd.valid_data, dtype=dtype)
+
+
+def test_mode_integer_type() -> None:
+    """Test mode of integer data is returned as an int."""
+    ct = CentralTendency(fd.valid_data)
+    assert isinstance(ct.mode(), int)
+
+
+def test_mode_integer_wide_span() -> None:
+    """Test mode of integer data spread over a wide range of values."""
+    ct = CentralTendency(fd.wide_span_data)
+    assert ct.mode() == 10**9
+
+
+def test_merge() -> None:
+    """Test merged dispersion matches the dispersion of the joined data."""
+    merged = Dispersion(fd.valid_data).merge(Dispersion(fd.mixed_sign_data))
+    whole = Dispersion(fd.valid_data + fd.mixed_sign_data)
+    assert merged.variance() == pytest.approx(whole.variance())
+    assert merged.range() == pytest.approx(whole.range())
+
+
+def test_merge_tree() -> None:
+    """Test merging merged summaries without keeping their data."""
+    chunks = [fd.valid_data, fd.valid_data2, fd.large_offset_data[:2]]
+    left = Dispersion(chunks[0]).merge(Dispersion(chunks[1]))
+    merged = left.merge(Dispersion(chunks[2]))
+    whole = Dispersion(chunks[0] + chunks[1] + chunks[2])
+    assert merged.data is None
+    assert merged.variance(sample=False) == pytest.approx(
+        whole.variance(sample=False)
+    )
+    assert merged.range() == whole.range()
+
+
+def test_range_int64_limits() -> None:
+    """Test range of integers whose difference exceeds int64."""
+    d = Dispersion(fd.int64_limit_data)
+    assert d.range() == 2**63
+
+
+def test_mode_int64_limits() -> None:
+    """Test mode of integers spanning almost the whole int64 range."""
+    ct = CentralTendency(fd.int64_limit_data)
+    assert ct.mode() == 2**62
+
+
+def test_range_nan() -> None:
+    """Test range propagates NaN like the other statistics."""
+    d = Dispersion(fd.nan_data)
+    assert math.isnan(d.range())
+
+
+def test_mean_big_ints() -> None:
+    """Test mean of integers too large for 64 bits."""
+    ct = CentralTendency(fd.big_int_data)
+    assert ct.mean() == sum(fd.big_int_data) / 3
+
+
+def test_mode_multi_first_seen_order() -> None:
+    """Test multiple modes are returned in first-seen order."""
+    assert CentralTendency(fd.unsorted_modes_data).mode() == [3, 1]
+    floats = [float(x) for x in fd.unsorted_modes_data]
+    assert CentralTendency(floats).mode() == [3.0, 1.0]
+
+
+def test_median_integer_type() -> None:
+    """Test median of integer data keeps int type for odd lengths."""
+    assert isinstance(CentralTendency(fd.valid_data).median(), int)
+    assert isinstance(CentralTendency(fd.large_data[1:]).median(), int)
+    assert CentralTendency(fd.unsorted_modes_data).median() == 2.0
+
+
+def test_mean_int64_sum_overflow() -> None:
+    """Test mean of integers whose sum does not fit in int64."""
+    ct = CentralTendency(fd.int64_sum_overflow_data)
+    assert ct.mean() == pytest.approx(2**62)
+
+
+def test_uint64_limits() -> None:
+    """Test integers above the int64 range are not wrapped."""
+    arr = np.array(fd.uint64_data, dtype=np.uint64)
+    ct = CentralTendency(arr)
+    assert ct.mean() == pytest.approx(2**63)
+    assert ct.mode() == 2**63
+    assert ct.median() == 2**63
+    assert Dispersion(arr).range() == 0
+    assert CentralTendency(fd.uint64_data).mean() == pytest.approx(2**63)
+
+
+def test_mode_bool() -> None:
+    """Test mode of boolean data is returned as a bool."""
+    assert CentralTendency(fd.bool_data).mode() is True
+    modes = CentralTendency([True, False]).mode()
+    assert modes == [True, False]
+    assert all(isinstance(m, bool) for m in modes)
+
+
+def test_big_ints_exact() -> None:
+    """Test range, mode and median of integers beyond 64 bits are exact."""
+    assert Dispersion(fd.big_int_data).range() == 2**64 + 1
+    ct = CentralTendency(fd.big_int_data + [2**64 + 2])
+    assert ct.mode() == 2**64 + 2
+    assert isinstance(ct.mode(), int)
+    large = [2**64 + i for i in range(65)]
+    assert CentralTendency(large).median() == 2**64 + 32
+
+
+def test_merge_subclass() -> None:
+    """Test merging subclass instances keeps the subclass."""
+
+    class Sub(Dispersion):
+        pass
+
+    merged = Sub(fd.valid_data).merge(Sub(fd.valid_data2))
+    assert isinstance(merged, Sub)
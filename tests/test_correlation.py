@@ -1,6 +1,9 @@
 """Tests for correlation."""
 
+import math
+
 import fake_data as fd
+import numpy as np
 import pytest
 from ministats import Correlation
 
@@ -21,3 +24,39 @@ def test_correlation_zero_variance() -> None:
     """Test correlation function raises Error with zero variance data."""
     with pytest.raises(ZeroDivisionError):
         Correlation(fd.constant_data, fd.constant_data).correlation()
+
+
+def test_batch_correlate() -> None:
+    """Test correlation matrix matches numpy's corrcoef."""
+    data = np.column_stack(
+        [fd.valid_data, fd.valid_data2, fd.mixed_sign_data]
+    )
+    expected = np.corrcoef(data, rowvar=False)
+    assert Correlation.batch_correlate(data) == pytest.approx(expected)
+
+
+def test_batch_correlate_zero_variance() -> None:
+    """Test batch correlation raises Error with a zero variance column."""
+    data = np.column_stack([fd.valid_data[:3], fd.constant_data])
+    with pytest.raises(ZeroDivisionError):
+        Correlation.batch_correlate(data)
+
+
+def test_correlate_many() -> None:
+    """Test each row's correlation matches the single-pair correlation."""
+    rows = [fd.valid_data, fd.mixed_sign_data]
+    expected = [Correlation(row, fd.valid_data2).correlation() for row in rows]
+    result = Correlation.correlate_many(np.array(rows), fd.valid_data2)
+    assert result == pytest.approx(expected)
+
+
+def test_correlate_many_unequal_length() -> None:
+    """Test batch correlation raises ValueError on mismatched lengths."""
+    with pytest.raises(ValueError):
+        Correlation.correlate_many(np.array([fd.valid_data]), fd.unequal_data)
+
+
+def test_correlation_nan() -> None:
+    """Test correlation returns NaN when a dataset contains NaN."""
+    c = Correlation(fd.nan_data, fd.valid_data[:3])
+    assert math.isnan(c.correlation())
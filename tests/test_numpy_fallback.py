@@ -0,0 +1,64 @@
+"""Tests for the NumPy fallback used when numba is not installed."""
+
+import importlib
+import math
+import sys
+from collections.abc import Iterator
+from types import ModuleType
+
+import fake_data as fd
+import ministats
+import pytest
+
+
+def _statistics(module: ModuleType) -> dict[str, float]:
+    """Compute the kernel-backed statistics with the given module."""
+    d = module.Dispersion(fd.mixed_sign_data)
+    c = module.Correlation(fd.valid_data, fd.mixed_sign_data)
+    return {
+        "variance": d.variance(),
+        "range": d.range(),
+        "covariance": c.covariance(),
+        "correlation": c.correlation(),
+    }
+
+
+@pytest.fixture(scope="module")
+def compiled_stats() -> dict[str, float]:
+    """Statistics from ministats as imported, with numba if installed."""
+    return _statistics(ministats)
+
+
+@pytest.fixture
+def fallback(monkeypatch: pytest.MonkeyPatch) -> Iterator[ModuleType]:
+    """Reload ministats with numba blocked, restoring it afterwards."""
+    monkeypatch.setitem(sys.modules, "numba", None)
+    yield importlib.reload(ministats)
+    monkeypatch.undo()
+    importlib.reload(ministats)
+
+
+def test_fallback_is_active(fallback: ModuleType) -> None:
+    """Test blocking numba switches ministats to the NumPy kernels."""
+    assert fallback.njit is None
+
+
+def test_fallback_matches_compiled(
+    compiled_stats: dict[str, float], fallback: ModuleType
+) -> None:
+    """Test NumPy fallback results match the default backend."""
+    assert _statistics(fallback) == pytest.approx(compiled_stats)
+
+
+def test_fallback_correlation_nan(fallback: ModuleType) -> None:
+    """Test NumPy fallback correlation returns NaN for NaN input."""
+    c = fallback.Correlation(fd.nan_data, fd.valid_data[:3])
+    assert math.isnan(c.correlation())
+    assert math.isnan(fallback.Dispersion(fd.nan_data).range())
+
+
+def test_fallback_correlation_zero_variance(fallback: ModuleType) -> None:
+    """Test NumPy fallback correlation raises Error with zero variance."""
+    c = fallback.Correlation(fd.constant_data, fd.constant_data)
+    with pytest.raises(ZeroDivisionError):
+        c.correlation()
@@ -1,6 +1,7 @@
 """Tests for validator."""
 
 import fake_data as fd
+import numpy as np
 import pytest
 from ministats import Validator
 
@@ -31,3 +32,27 @@ def test_validate_equal_length_invalid() -> None:
     """Test validation raises ValueError when lists have unequal lengths."""
     with pytest.raises(ValueError):
         Validator.validate_equal_length(fd.valid_data, fd.unequal_data)
+
+
+def test_validate_numeric_list_returns_array() -> None:
+    """Test validation returns the input converted to a numpy array."""
+    arr = Validator.validate_numeric_list(fd.valid_data)
+    assert isinstance(arr, np.ndarray)
+    assert arr.tolist() == fd.valid_data
+
+
+def test_validate_numeric_list_non_numeric_array() -> None:
+    """Test validation raises TypeError for a non-numeric numpy array."""
+    with pytest.raises(TypeError):
+        Validator.validate_numeric_list(np.array(fd.non_numeric_data))
+
+
+def test_validate_numeric_list_big_ints() -> None:
+    """Test validation accepts integers too large for 64 bits."""
+    Validator.validate_numeric_list(fd.big_int_data)
+
+
+def test_validate_numeric_list_big_ints_non_numeric() -> None:
+    """Test validation rejects non-numeric values mixed with big integers."""
+    with pytest.raises(TypeError):
+        Validator.validate_numeric_list(fd.big_int_data + ["a"])